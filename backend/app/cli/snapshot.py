@@ -0,0 +1,61 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+from backend.app.database.snapshot import load_qa_dataset
+from backend.app.database.qdrant_manager import QdrantManager, MAX_BATCH_SIZE, MAX_INGEST_WORKERS
+
+
+def bounded_int(upper: int):
+    def parse(value: str) -> int:
+        number = int(value)
+        if not 0 < number <= upper:
+            raise argparse.ArgumentTypeError(f"must be between 1 and {upper}")
+        return number
+    return parse
+
+
+def print_progress(done: int, total: int):
+    print(f"\r{done}/{total} points", end="", file=sys.stderr, flush=True)
+    if done >= total:
+        print(file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Export, import and bulk ingest Q&A cache collections")
+    parser.add_argument("--embedding-model", default="nomic-embed-text")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export a collection's Q&A pairs and vectors to a snapshot directory")
+    export_parser.add_argument("collection")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--batch-size", type=bounded_int(MAX_BATCH_SIZE), default=256)
+
+    import_parser = subparsers.add_parser("import", help="Import a snapshot directory, reusing vectors when the embedding model matches")
+    import_parser.add_argument("collection")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--batch-size", type=bounded_int(MAX_BATCH_SIZE), default=256)
+
+    ingest_parser = subparsers.add_parser("ingest", help="Embed and upsert a question/answer dataset (JSONL or CSV)")
+    ingest_parser.add_argument("collection")
+    ingest_parser.add_argument("dataset")
+    ingest_parser.add_argument("--usecase", default="Basic Chatbot")
+    ingest_parser.add_argument("--batch-size", type=bounded_int(MAX_BATCH_SIZE), default=64)
+    ingest_parser.add_argument("--workers", type=bounded_int(MAX_INGEST_WORKERS), default=4)
+
+    args = parser.parse_args(argv)
+
+    manager = QdrantManager(collection_name=args.collection, embedding_model=args.embedding_model)
+    if args.command == "export":
+        result = manager.export_snapshot(args.path, batch_size=args.batch_size)
+    elif args.command == "import":
+        result = manager.import_snapshot(args.path, batch_size=args.batch_size, progress=print_progress)
+    else:
+        pairs = load_qa_dataset(args.dataset)
+        result = manager.bulk_ingest(pairs, usecase=args.usecase, batch_size=args.batch_size, workers=args.workers, progress=print_progress)
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import json
+from collections import defaultdict
+from typing import List, Dict, Optional, Any, Iterable
+from backend.app.common.logger import logger
+
+DEFAULT_THRESHOLDS = [0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95]
+USECASE_COLLECTIONS = {"AI News": "ai_news_collection"}
+USECASE_PAYLOAD_FILTERS = {"AI News": {"type": "news_fetch"}}
+# A cached AI News fetch only skips the Tavily search; summarize_news still calls the LLM.
+LLM_CALLS_PER_HIT = {"AI News": 0}
+
+
+def load_queries(path: str, usecase: Optional[str] = None) -> List[Dict[str, Any]]:
+    queries = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed query log line: {line[:80]}")
+                continue
+            if usecase and entry.get("usecase") != usecase:
+                continue
+            queries.append(entry)
+    return queries
+
+
+def evaluate_thresholds(scores: Iterable[Optional[float]], thresholds: Iterable[float], llm_calls_per_hit: int = 1) -> List[Dict[str, Any]]:
+    scores = list(scores)
+    report = []
+    for threshold in thresholds:
+        hits = sum(1 for score in scores if score is not None and score >= threshold)
+        report.append({
+            "threshold": threshold,
+            "queries": len(scores),
+            "hits": hits,
+            "hit_rate": hits / len(scores) if scores else 0.0,
+            "llm_calls_avoided": hits * llm_calls_per_hit,
+        })
+    return report
+
+
+def replay_scores(queries: List[Dict[str, Any]], embedding_model: str) -> Dict[str, List[Optional[float]]]:
+    from backend.app.database.qdrant_manager import QdrantManager
+    managers: Dict[str, QdrantManager] = {}
+    scores: Dict[str, List[Optional[float]]] = defaultdict(list)
+    for entry in queries:
+        usecase = entry["usecase"]
+        if entry.get("source") == "exact":
+            # Exact shared-cache hits are served before the similarity search, whatever the threshold.
+            scores[usecase].append(1.0)
+            continue
+        collection_name = USECASE_COLLECTIONS.get(usecase, "qa_collection")
+        if collection_name not in managers:
+            managers[collection_name] = QdrantManager(collection_name=collection_name, embedding_model=embedding_model)
+        try:
+            scores[usecase].append(managers[collection_name].top_match_score(entry["query"], usecase, stored_before=entry.get("ts"), payload_filter=USECASE_PAYLOAD_FILTERS.get(usecase)))
+        except Exception as e:
+            logger.error(f"Error replaying query '{entry['query']}': {e}")
+    return scores
+
+
+def logged_scores(queries: List[Dict[str, Any]]) -> Dict[str, List[Optional[float]]]:
+    scores: Dict[str, List[Optional[float]]] = defaultdict(list)
+    for entry in queries:
+        scores[entry["usecase"]].append(entry.get("top_score"))
+    return scores
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Replay logged cache queries and report hit rate per similarity threshold")
+    parser.add_argument("log", help="JSONL query log written when CACHE_QUERY_LOG_PATH is set")
+    parser.add_argument("--usecase", help="Only replay queries for this usecase")
+    parser.add_argument("--embedding-model", default="nomic-embed-text")
+    parser.add_argument("--thresholds", default=",".join(str(t) for t in DEFAULT_THRESHOLDS), help="Comma separated candidate thresholds")
+    parser.add_argument("--logged-scores", action="store_true", help="Use top-1 scores recorded at query time instead of querying Qdrant")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    thresholds = [float(t) for t in args.thresholds.split(",") if t.strip()]
+    queries = load_queries(args.log, args.usecase)
+    scores = logged_scores(queries) if args.logged_scores else replay_scores(queries, args.embedding_model)
+    report = {usecase: evaluate_thresholds(values, thresholds, LLM_CALLS_PER_HIT.get(usecase, 1)) for usecase, values in scores.items()}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return report
+    for usecase, rows in report.items():
+        print(f"\n{usecase} ({rows[0]['queries'] if rows else 0} queries)")
+        print(f"{'threshold':>10} {'hits':>8} {'hit_rate':>9} {'llm_calls_avoided':>18}")
+        for row in rows:
+            print(f"{row['threshold']:>10.2f} {row['hits']:>8} {row['hit_rate']:>9.1%} {row['llm_calls_avoided']:>18}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
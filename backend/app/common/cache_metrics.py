@@ -0,0 +1,83 @@
+import os
+import json
+import threading
+import time
+from typing import Dict, Optional, Any
+from backend.app.common.logger import logger
+from backend.app.database.shared_cache import get_shared_cache
+
+HISTOGRAM_BUCKETS = 20
+
+class CacheMetrics:
+    def __init__(self, buckets: int = HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, Any]] = {}
+
+    def bucket_for(self, score: float) -> int:
+        return min(max(int(score * self.buckets), 0), self.buckets - 1)
+
+    def bucket_label(self, bucket: int) -> str:
+        return f"{bucket / self.buckets:.2f}-{(bucket + 1) / self.buckets:.2f}"
+
+    def _update(self, usecase: str, hit: Optional[bool] = None, bucket: Optional[int] = None):
+        shared_cache = get_shared_cache()
+        if shared_cache is not None and shared_cache.record_lookup(usecase, hit, bucket):
+            return
+        with self._lock:
+            entry = self._counters.setdefault(usecase, {"hits": 0, "misses": 0, "histogram": {}})
+            if hit is not None:
+                entry["hits" if hit else "misses"] += 1
+            if bucket is not None:
+                entry["histogram"][bucket] = entry["histogram"].get(bucket, 0) + 1
+
+    def record(self, usecase: str, hit: bool):
+        self._update(usecase, hit=hit)
+
+    def record_lookup(self, usecase: str, top_score: Optional[float], query: Optional[str] = None, threshold: Optional[float] = None, source: str = "semantic"):
+        if top_score is not None:
+            self._update(usecase, bucket=self.bucket_for(top_score))
+        if query is not None:
+            self._log_query(usecase, query, top_score, threshold, source)
+
+    def _log_query(self, usecase: str, query: str, top_score: Optional[float], threshold: Optional[float], source: str):
+        path = os.getenv("CACHE_QUERY_LOG_PATH")
+        if not path:
+            return
+        line = json.dumps({"ts": time.time(), "usecase": usecase, "query": query, "top_score": top_score, "threshold": threshold, "source": source})
+        try:
+            with open(path, "a") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"Could not append to cache query log {path}: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        shared_cache = get_shared_cache()
+        raw: Dict[str, Dict[str, Any]] = shared_cache.lookup_stats() if shared_cache is not None else {}
+        with self._lock:
+            for usecase, entry in self._counters.items():
+                merged = raw.setdefault(usecase, {"hits": 0, "misses": 0, "histogram": {}})
+                merged["hits"] += entry["hits"]
+                merged["misses"] += entry["misses"]
+                for bucket, count in entry["histogram"].items():
+                    merged["histogram"][bucket] = merged["histogram"].get(bucket, 0) + count
+        usecases = {}
+        for usecase, entry in raw.items():
+            total = entry["hits"] + entry["misses"]
+            usecases[usecase] = {
+                "hits": entry["hits"],
+                "misses": entry["misses"],
+                "hit_rate": entry["hits"] / total if total else 0.0,
+                "top1_score_histogram": {self.bucket_label(b): entry["histogram"][b] for b in sorted(entry["histogram"])},
+            }
+        return {"shared": shared_cache is not None, "usecases": usecases}
+
+    def reset(self):
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.reset_lookup_stats()
+        with self._lock:
+            self._counters.clear()
+
+
+cache_metrics = CacheMetrics()
@@ -0,0 +1,59 @@
+import gzip
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def make_etag(content: bytes) -> str:
+    return f'W/"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+
+def is_not_modified(etag: str, mtime: float, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        opaque = etag[2:] if etag.startswith("W/") else etag
+        return "*" in candidates or any((tag[2:] if tag.startswith("W/") else tag) == opaque for tag in candidates)
+    if if_modified_since:
+        try:
+            return int(mtime) <= int(parsedate_to_datetime(if_modified_since).timestamp())
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    accepted: Dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.lower()] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress(content: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(content), "br"
+    if encoding == "gzip":
+        return gzip.compress(content), "gzip"
+    return content, None
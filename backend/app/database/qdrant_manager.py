@@ -1,13 +1,28 @@
 import os
 import hashlib
-from typing import List, Dict, Optional, Any
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Any, Callable
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct, PayloadSchemaType
 from langchain_community.embeddings import OllamaEmbeddings
 from langchain_openai import OpenAIEmbeddings
 from backend.app.common.logger import logger
+from backend.app.database.shared_cache import get_shared_cache
+from backend.app.common.cache_metrics import cache_metrics
+from backend.app.database.snapshot import write_snapshot, read_manifest, read_snapshot
 import numpy as np
 
+MAX_BATCH_SIZE = 1024
+MAX_INGEST_WORKERS = 16
+
+
+def check_bulk_limits(batch_size: int, workers: int = 1):
+    if not 0 < batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}, got {batch_size}")
+    if not 0 < workers <= MAX_INGEST_WORKERS:
+        raise ValueError(f"workers must be between 1 and {MAX_INGEST_WORKERS}, got {workers}")
+
 class QdrantManager:
     def __init__(self, collection_name: str = "qa_collection", embedding_model: str = "nomic-embed-text"):
         self.client = QdrantClient(
@@ -26,12 +41,13 @@ class QdrantManager:
                 model=embedding_model,
                 base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
             )
+        self.cache = get_shared_cache()
         self.vector_size = self._get_vector_size()
         self._ensure_collection_exists()
 
     def _get_vector_size(self) -> int:
         try:
-            sample_embedding = self.embeddings.embed_query("sample text for dimension detection")
+            sample_embedding = self._embed_query("sample text for dimension detection")
             return len(sample_embedding)
         except Exception as e:
             logger.warning(f"Could not determine vector size automatically: {e}")
@@ -45,7 +61,7 @@ class QdrantManager:
             }
             return model_sizes.get(self.embedding_model, 768)
 
-    def _ensure_collection_exists(self):
+    def _ensure_collection_exists(self, vectors_config: Optional[VectorParams] = None):
         try:
             collections = self.client.get_collections()
             collection_names = [col.name for col in collections.collections]
@@ -53,7 +69,7 @@ class QdrantManager:
                 logger.info(f"Creating collection: {self.collection_name}")
                 self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE)
+                    vectors_config=vectors_config or VectorParams(size=self.vector_size, distance=Distance.COSINE)
                 )
                 self.client.create_payload_index(
                     collection_name=self.collection_name,
@@ -73,21 +89,49 @@ class QdrantManager:
             logger.error(f"Error creating collection: {e}")
             raise
 
+    def _embed_query(self, text: str) -> List[float]:
+        if self.cache is not None:
+            cached = self.cache.get_embedding(self.embedding_model, text)
+            if cached is not None:
+                return cached
+        embedding = self.embeddings.embed_query(text)
+        if self.cache is not None:
+            self.cache.put_embedding(self.embedding_model, text, embedding)
+        return embedding
+
+    def _embed_queries(self, texts: List[str]) -> List[List[float]]:
+        # Stored questions must be embedded like live queries: OllamaEmbeddings prefixes
+        # embed_documents with "passage: " but embed_query with "query: ".
+        if isinstance(self.embeddings, OpenAIEmbeddings):
+            vectors = [self.cache.get_embedding(self.embedding_model, t) if self.cache is not None else None for t in texts]
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if missing:
+                for i, vector in zip(missing, self.embeddings.embed_documents([texts[i] for i in missing])):
+                    vectors[i] = vector
+                    if self.cache is not None:
+                        self.cache.put_embedding(self.embedding_model, texts[i], vector)
+            return vectors
+        return [self._embed_query(text) for text in texts]
+
     def _generate_id(self, text: str) -> str:
         return hashlib.md5(text.encode()).hexdigest()
 
+    def _build_point(self, question: str, answer: str, usecase: str, vector: List[float], metadata: Optional[Dict] = None) -> PointStruct:
+        payload = {
+            "question": question,
+            "answer": answer,
+            "usecase": usecase,
+            "timestamp": np.datetime64('now').astype('datetime64[s]').item().isoformat(),
+            **(metadata or {})
+        }
+        point_id = self._generate_id(f"{question}_{usecase}")
+        return PointStruct(id=point_id, vector=vector, payload=payload)
+
     def store_qa_pair(self, question: str, answer: str, usecase: str, metadata: Optional[Dict] = None) -> bool:
         try:
-            question_embedding = self.embeddings.embed_query(question)
-            payload = {
-                "question": question,
-                "answer": answer,
-                "usecase": usecase,
-                "timestamp": np.datetime64('now').astype('datetime64[s]').item().isoformat(),
-                **(metadata or {})
-            }
-            point_id = self._generate_id(f"{question}_{usecase}")
-            point = PointStruct(id=point_id, vector=question_embedding, payload=payload)
+            question_embedding = self._embed_query(question)
+            point = self._build_point(question, answer, usecase, question_embedding, metadata)
+            point_id = point.id
             self.client.upsert(collection_name=self.collection_name, points=[point])
             logger.info(f"Stored Q&A pair with ID: {point_id}")
             return True
@@ -95,27 +139,178 @@ class QdrantManager:
             logger.error(f"Error storing Q&A pair: {e}")
             return False
 
-    def search_similar_questions(self, query: str, usecase: str, limit: int = 5, score_threshold: float = 0.7) -> List[Dict[str, Any]]:
+    def _query_points(self, query_embedding: List[float], usecase: str, limit: int, payload_filter: Optional[Dict[str, Any]] = None, stored_before: Optional[float] = None):
+        conditions = [models.FieldCondition(key="usecase", match=models.MatchValue(value=usecase))]
+        for key, value in (payload_filter or {}).items():
+            conditions.append(models.FieldCondition(key=key, match=models.MatchValue(value=value)))
+        if stored_before is not None:
+            # Payload timestamps have second resolution, so only earlier whole seconds are safe to keep.
+            cutoff = datetime.fromtimestamp(int(stored_before), tz=timezone.utc)
+            conditions.append(models.FieldCondition(key="timestamp", range=models.DatetimeRange(lt=cutoff)))
+        return self.client.query_points(
+            collection_name=self.collection_name,
+            query=query_embedding,
+            query_filter=models.Filter(must=conditions),
+            limit=limit
+        ).points
+
+    def search_similar_questions(self, query: str, usecase: str, limit: int = 5, score_threshold: float = 0.7, payload_filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         try:
-            query_embedding = self.embeddings.embed_query(query)
-            search_results = self.client.search(
-                collection_name=self.collection_name,
-                query_vector=query_embedding,
-                query_filter=models.Filter(must=[models.FieldCondition(key="usecase", match=models.MatchValue(value=usecase))]),
-                limit=limit,
-                score_threshold=score_threshold
-            )
+            query_embedding = self._embed_query(query)
+            search_results = self._query_points(query_embedding, usecase, limit, payload_filter)
+            top_score = search_results[0].score if search_results else None
             results = []
             for result in search_results:
+                if result.score < score_threshold:
+                    continue
                 results.append({
                     "question": result.payload["question"],
                     "answer": result.payload["answer"],
                     "score": result.score,
                     "metadata": {k: v for k, v in result.payload.items() if k not in ["question", "answer"]}
                 })
+            cache_metrics.record_lookup(usecase, top_score, query=query, threshold=score_threshold)
             logger.info(f"Found {len(results)} similar questions for query: {query}")
             return results
         except Exception as e:
             logger.error(f"Error searching similar questions: {e}")
             return []
 
+    def top_match_score(self, query: str, usecase: str, stored_before: Optional[float] = None, payload_filter: Optional[Dict[str, Any]] = None) -> Optional[float]:
+        query_embedding = self._embed_query(query)
+        results = self._query_points(query_embedding, usecase, limit=1, payload_filter=payload_filter, stored_before=stored_before)
+        return results[0].score if results else None
+
+    def _collection_vectors_config(self) -> VectorParams:
+        return self.client.get_collection(collection_name=self.collection_name).config.params.vectors
+
+    def get_collection_stats(self) -> Dict[str, Any]:
+        try:
+            info = self.client.get_collection(collection_name=self.collection_name)
+            return {
+                "collection_name": self.collection_name,
+                "vector_size": info.config.params.vectors.size,
+                "distance": str(info.config.params.vectors.distance),
+                "embedding_model": self.embedding_model,
+                "embedding_vector_size": self.vector_size,
+                "status": str(info.status),
+                "points_count": info.points_count,
+                "indexed_vectors_count": info.indexed_vectors_count,
+                "segments_count": info.segments_count,
+            }
+        except Exception as e:
+            logger.error(f"Error getting collection stats: {e}")
+            return {"collection_name": self.collection_name, "error": str(e)}
+
+    def _stored_usecases(self) -> set:
+        usecases, offset = set(), None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=1000,
+                offset=offset,
+                with_payload=["usecase"],
+                with_vectors=False
+            )
+            usecases.update(p.payload.get("usecase") for p in points if p.payload.get("usecase"))
+            if offset is None:
+                return usecases
+
+    def clear_collection(self) -> bool:
+        try:
+            vectors_config = self._collection_vectors_config()
+            usecases = self._stored_usecases() if self.cache is not None else set()
+            self.client.delete_collection(collection_name=self.collection_name)
+            logger.info(f"Deleted collection: {self.collection_name}")
+            self._ensure_collection_exists(vectors_config)
+            for usecase in usecases:
+                self.cache.clear_answers(usecase)
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing collection: {e}")
+            return False
+
+    def _iter_points(self, batch_size: int):
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True
+            )
+            if points:
+                yield [p.id for p in points], [p.vector for p in points], [p.payload for p in points]
+            if offset is None:
+                break
+
+    def _checked_vector_size(self) -> int:
+        collection_vector_size = self._collection_vectors_config().size
+        if collection_vector_size != self.vector_size:
+            raise ValueError(
+                f"{self.collection_name} stores vectors of size {collection_vector_size}, "
+                f"but {self.embedding_model} produces size {self.vector_size}"
+            )
+        return collection_vector_size
+
+    def export_snapshot(self, path: str, batch_size: int = 256) -> Dict[str, Any]:
+        check_bulk_limits(batch_size)
+        collection_vector_size = self._checked_vector_size()
+        manifest = write_snapshot(path, self.collection_name, self.embedding_model, collection_vector_size, self._iter_points(batch_size))
+        logger.info(f"Exported {manifest['count']} points from {self.collection_name} to {path}")
+        return manifest
+
+    def import_snapshot(self, path: str, batch_size: int = 256, progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        check_bulk_limits(batch_size)
+        manifest = read_manifest(path)
+        self._checked_vector_size()
+        if manifest["embedding_model"] != self.embedding_model:
+            reuse_vectors = False
+            logger.info(f"Snapshot embedding model {manifest['embedding_model']} differs from {self.embedding_model}, re-embedding questions")
+        elif manifest["vector_size"] != self.vector_size:
+            reuse_vectors = False
+            logger.info(f"Snapshot vector size {manifest['vector_size']} differs from {self.vector_size} for {self.embedding_model}, re-embedding questions")
+        else:
+            reuse_vectors = True
+        imported = 0
+        for ids, vectors, payloads in read_snapshot(path, batch_size=batch_size, with_vectors=reuse_vectors):
+            if reuse_vectors:
+                batch_vectors = vectors.tolist()
+            else:
+                batch_vectors = self._embed_queries([p["question"] for p in payloads])
+            points = [PointStruct(id=point_id, vector=vector, payload=payload) for point_id, vector, payload in zip(ids, batch_vectors, payloads)]
+            self.client.upsert(collection_name=self.collection_name, points=points)
+            imported += len(points)
+            if progress:
+                progress(imported, manifest["count"])
+        logger.info(f"Imported {imported} points into {self.collection_name} from {path}")
+        return {"collection_name": self.collection_name, "imported": imported, "reused_vectors": reuse_vectors, "source": manifest}
+
+    def _ingest_batch(self, pairs: List[Dict[str, Any]], usecase: str) -> int:
+        questions = [pair["question"] for pair in pairs]
+        vectors = self._embed_queries(questions)
+        points = [
+            self._build_point(pair["question"], pair["answer"], pair.get("usecase") or usecase, vector, {"method": "bulk_ingest"})
+            for pair, vector in zip(pairs, vectors)
+        ]
+        self.client.upsert(collection_name=self.collection_name, points=points)
+        return len(points)
+
+    def bulk_ingest(self, pairs: List[Dict[str, Any]], usecase: str, batch_size: int = 64, workers: int = 4, progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        check_bulk_limits(batch_size, workers)
+        pairs = [pair for pair in pairs if pair.get("question") and pair.get("answer")]
+        batches = [pairs[i:i + batch_size] for i in range(0, len(pairs), batch_size)]
+        ingested, failed = 0, 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._ingest_batch, batch, usecase): len(batch) for batch in batches}
+            for future in as_completed(futures):
+                try:
+                    ingested += future.result()
+                except Exception as e:
+                    failed += futures[future]
+                    logger.error(f"Error ingesting batch into {self.collection_name}: {e}")
+                if progress:
+                    progress(ingested + failed, len(pairs))
+        logger.info(f"Bulk ingested {ingested}/{len(pairs)} Q&A pairs into {self.collection_name}")
+        return {"collection_name": self.collection_name, "ingested": ingested, "failed": failed, "total": len(pairs)}
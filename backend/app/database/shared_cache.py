@@ -0,0 +1,257 @@
+import os
+import sqlite3
+import threading
+import time
+import hashlib
+from functools import lru_cache
+from typing import List, Dict, Optional, Any
+import numpy as np
+from backend.app.common.logger import logger
+
+DEFAULT_CACHE_PATH = os.path.join(os.getenv("TMPDIR", "/tmp"), "genai_chat_shared_cache.sqlite3")
+DEFAULT_MAX_EMBEDDINGS = 50000
+DEFAULT_MAX_ANSWERS = 10000
+PRUNE_EVERY_WRITES = 100
+
+class SharedCache:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, answer_ttl: Optional[float] = None, busy_timeout_ms: int = 5000,
+                 max_embeddings: int = DEFAULT_MAX_EMBEDDINGS, max_answers: int = DEFAULT_MAX_ANSWERS, prune_every: int = PRUNE_EVERY_WRITES):
+        self.path = path
+        self.answer_ttl = answer_ttl
+        self.busy_timeout_ms = busy_timeout_ms
+        self.max_embeddings = max_embeddings
+        self.max_answers = max_answers
+        self.prune_every = max(1, prune_every)
+        self._writes = 0
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, dim INTEGER NOT NULL, "
+            "vector BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "key TEXT PRIMARY KEY, usecase TEXT NOT NULL, question TEXT NOT NULL, "
+            "answer TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS embeddings_created_at ON embeddings (created_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS answers_created_at ON answers (created_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS lookup_counters ("
+            "usecase TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS score_histogram ("
+            "usecase TEXT NOT NULL, bucket INTEGER NOT NULL, count INTEGER NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (usecase, bucket))"
+        )
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def normalize_question(question: str) -> str:
+        return " ".join(question.lower().split())
+
+    def get_embedding(self, model: str, text: str) -> Optional[List[float]]:
+        try:
+            row = self._connect().execute(
+                "SELECT dim, vector FROM embeddings WHERE key = ?", (self._key(model, text),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache embedding lookup failed: {e}")
+            return None
+        if row is None:
+            return None
+        dim, blob = row
+        vector = np.frombuffer(blob, dtype=np.float32)
+        if vector.shape[0] != dim:
+            return None
+        return vector.tolist()
+
+    def put_embedding(self, model: str, text: str, vector: List[float]) -> bool:
+        data = np.asarray(vector, dtype=np.float32)
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, dim, vector, created_at) VALUES (?, ?, ?, ?, ?)",
+                (self._key(model, text), model, int(data.shape[0]), data.tobytes(), time.time())
+            )
+            self._maybe_prune()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache embedding write failed: {e}")
+            return False
+
+    def get_answer(self, usecase: str, question: str) -> Optional[str]:
+        try:
+            row = self._connect().execute(
+                "SELECT answer, created_at FROM answers WHERE key = ?",
+                (self._key(usecase, self.normalize_question(question)),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache answer lookup failed: {e}")
+            return None
+        if row is None:
+            return None
+        answer, created_at = row
+        if self.answer_ttl is not None and time.time() - created_at > self.answer_ttl:
+            return None
+        return answer
+
+    def put_answer(self, usecase: str, question: str, answer: str) -> bool:
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO answers (key, usecase, question, answer, created_at) VALUES (?, ?, ?, ?, ?)",
+                (self._key(usecase, self.normalize_question(question)), usecase, question, answer, time.time())
+            )
+            self._maybe_prune()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache answer write failed: {e}")
+            return False
+
+    def _maybe_prune(self):
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self.prune()
+
+    def prune(self) -> Dict[str, int]:
+        removed = {"expired_answers": 0, "embeddings": 0, "answers": 0}
+        try:
+            conn = self._connect()
+            if self.answer_ttl is not None:
+                removed["expired_answers"] = conn.execute(
+                    "DELETE FROM answers WHERE created_at < ?", (time.time() - self.answer_ttl,)
+                ).rowcount
+            for table, limit in (("embeddings", self.max_embeddings), ("answers", self.max_answers)):
+                removed[table] = conn.execute(
+                    f"DELETE FROM {table} WHERE key IN "
+                    f"(SELECT key FROM {table} ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (limit,)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache prune failed: {e}")
+        return removed
+
+    def record_lookup(self, usecase: str, hit: Optional[bool] = None, bucket: Optional[int] = None) -> bool:
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if hit is not None:
+                    column = "hits" if hit else "misses"
+                    conn.execute(
+                        f"INSERT INTO lookup_counters (usecase, {column}) VALUES (?, 1) "
+                        f"ON CONFLICT(usecase) DO UPDATE SET {column} = {column} + 1",
+                        (usecase,)
+                    )
+                if bucket is not None:
+                    conn.execute(
+                        "INSERT INTO score_histogram (usecase, bucket, count) VALUES (?, ?, 1) "
+                        "ON CONFLICT(usecase, bucket) DO UPDATE SET count = count + 1",
+                        (usecase, bucket)
+                    )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache lookup counter write failed: {e}")
+            return False
+
+    def lookup_stats(self) -> Dict[str, Dict[str, Any]]:
+        conn = self._connect()
+        result: Dict[str, Dict[str, Any]] = {}
+        for usecase, hits, misses in conn.execute("SELECT usecase, hits, misses FROM lookup_counters"):
+            result[usecase] = {"hits": hits, "misses": misses, "histogram": {}}
+        for usecase, bucket, count in conn.execute("SELECT usecase, bucket, count FROM score_histogram"):
+            result.setdefault(usecase, {"hits": 0, "misses": 0, "histogram": {}})["histogram"][bucket] = count
+        return result
+
+    def reset_lookup_stats(self) -> bool:
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM lookup_counters")
+            conn.execute("DELETE FROM score_histogram")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error resetting shared cache lookup stats: {e}")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        embeddings = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        answers = conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        size = sum(os.path.getsize(p) for p in (self.path, f"{self.path}-wal") if os.path.exists(p))
+        return {
+            "path": self.path,
+            "embeddings": embeddings,
+            "answers": answers,
+            "max_embeddings": self.max_embeddings,
+            "max_answers": self.max_answers,
+            "answer_ttl": self.answer_ttl,
+            "size_bytes": size,
+        }
+
+    def clear_answers(self, usecase: Optional[str] = None) -> bool:
+        try:
+            if usecase is None:
+                self._connect().execute("DELETE FROM answers")
+            else:
+                self._connect().execute("DELETE FROM answers WHERE usecase = ?", (usecase,))
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing shared cache answers: {e}")
+            return False
+
+    def clear(self) -> bool:
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM embeddings")
+            conn.execute("DELETE FROM answers")
+            conn.execute("VACUUM")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing shared cache: {e}")
+            return False
+
+
+@lru_cache(maxsize=None)
+def _shared_cache_for(path: str, answer_ttl: Optional[float], max_embeddings: int, max_answers: int) -> SharedCache:
+    return SharedCache(path=path, answer_ttl=answer_ttl, max_embeddings=max_embeddings, max_answers=max_answers)
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    if os.getenv("SHARED_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    path = os.getenv("SHARED_CACHE_PATH", DEFAULT_CACHE_PATH)
+    ttl = os.getenv("SHARED_CACHE_ANSWER_TTL")
+    try:
+        return _shared_cache_for(
+            path,
+            float(ttl) if ttl else None,
+            int(os.getenv("SHARED_CACHE_MAX_EMBEDDINGS", DEFAULT_MAX_EMBEDDINGS)),
+            int(os.getenv("SHARED_CACHE_MAX_ANSWERS", DEFAULT_MAX_ANSWERS)),
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Shared cache unavailable at {path}: {e}")
+        return None
@@ -0,0 +1,79 @@
+import os
+import csv
+import json
+import time
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+import numpy as np
+
+MANIFEST_FILE = "manifest.json"
+VECTORS_FILE = "vectors.npy"
+PAYLOADS_FILE = "payloads.jsonl"
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot(path: str, collection_name: str, embedding_model: str, vector_size: int, batches: Iterator[Tuple[List[Any], List[List[float]], List[Dict[str, Any]]]]) -> Dict[str, Any]:
+    os.makedirs(path, exist_ok=True)
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    vectors = []
+    count = 0
+    with open(os.path.join(path, PAYLOADS_FILE), "w") as f:
+        for ids, batch_vectors, payloads in batches:
+            batch = np.asarray(batch_vectors, dtype=np.float32)
+            if batch.ndim != 2 or batch.shape != (len(ids), vector_size):
+                raise ValueError(f"Expected {len(ids)} vectors of size {vector_size}, got array of shape {batch.shape}")
+            for point_id, payload in zip(ids, payloads):
+                f.write(json.dumps({"id": str(point_id), "payload": payload}) + "\n")
+            vectors.append(batch)
+            count += len(ids)
+    matrix = np.concatenate(vectors) if vectors else np.zeros((0, vector_size), dtype=np.float32)
+    np.save(os.path.join(path, VECTORS_FILE), matrix)
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "collection_name": collection_name,
+        "embedding_model": embedding_model,
+        "vector_size": vector_size,
+        "count": count,
+        "created_at": time.time(),
+    }
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(path: str) -> Dict[str, Any]:
+    with open(os.path.join(path, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {manifest.get('version')}")
+    return manifest
+
+
+def read_snapshot(path: str, batch_size: int = 256, with_vectors: bool = True) -> Iterator[Tuple[List[str], Optional[np.ndarray], List[Dict[str, Any]]]]:
+    manifest = read_manifest(path)
+    vectors = np.load(os.path.join(path, VECTORS_FILE), mmap_mode="r") if with_vectors else None
+    if vectors is not None and vectors.shape != (manifest["count"], manifest["vector_size"]):
+        raise ValueError(f"Snapshot at {path} has vectors of shape {vectors.shape}, manifest expects ({manifest['count']}, {manifest['vector_size']})")
+    ids, payloads, start = [], [], 0
+    with open(os.path.join(path, PAYLOADS_FILE)) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            ids.append(entry["id"])
+            payloads.append(entry["payload"])
+            if len(ids) == batch_size:
+                yield ids, (np.asarray(vectors[start:start + len(ids)]) if vectors is not None else None), payloads
+                start += len(ids)
+                ids, payloads = [], []
+    if ids:
+        yield ids, (np.asarray(vectors[start:start + len(ids)]) if vectors is not None else None), payloads
+
+
+def load_qa_dataset(path: str) -> List[Dict[str, Any]]:
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            return [row for row in csv.DictReader(f)]
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
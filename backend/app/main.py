@@ -1,13 +1,20 @@
-from fastapi import FastAPI, HTTPException
+import hmac
+import time
+from fastapi import FastAPI, HTTPException, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import os
 from dotenv import load_dotenv
 from backend.app.common.logger import logger
 from backend.app.factories.llm_factory import LLMFactory
 from backend.app.services.chat_service import ChatService
-from backend.app.services.news_service import NewsService
+from backend.app.services.news_service import NewsService, SUMMARY_FRESHNESS
+from backend.app.common.http_cache import make_etag, http_date, is_not_modified, negotiate_encoding, compress
+from backend.app.repositories.qdrant_repository import QdrantRepository
+from backend.app.common.cache_metrics import cache_metrics
+from backend.app.database.shared_cache import get_shared_cache
+from backend.app.database.qdrant_manager import MAX_BATCH_SIZE, MAX_INGEST_WORKERS
 from .instrumentation import configure_observability
 
 load_dotenv()
@@ -105,3 +112,187 @@ def news_summary(req: NewsRequest):
     except Exception as e:
         logger.error(str(e))
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/news/summary/{frequency}")
+def latest_news_summary(
+    frequency: str,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    path = NewsService.latest_summary_path(frequency)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"No {frequency} summary available")
+    with open(path, "rb") as f:
+        mtime = os.fstat(f.fileno()).st_mtime
+        content = f.read()
+    etag = make_etag(content)
+    max_age = max(0, int(SUMMARY_FRESHNESS[frequency] - (time.time() - mtime)))
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(mtime),
+        "Cache-Control": f"public, max-age={max_age}",
+        "Vary": "Accept-Encoding",
+    }
+    if is_not_modified(etag, mtime, if_none_match, if_modified_since):
+        return Response(status_code=304, headers=headers)
+    body, encoding = compress(content, negotiate_encoding(accept_encoding))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="text/markdown; charset=utf-8", headers=headers)
+
+
+ADMIN_COLLECTIONS = ("qa_collection", "ai_news_collection")
+
+
+def require_admin(token: Optional[str]):
+    expected = os.getenv("ADMIN_API_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=503, detail="Admin endpoints are disabled: ADMIN_API_TOKEN is not set")
+    if not token or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+def admin_repository(collection_name: str, embedding_model: str) -> QdrantRepository:
+    if collection_name not in ADMIN_COLLECTIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown collection: {collection_name}")
+    return QdrantRepository(collection_name=collection_name, embedding_model=embedding_model)
+
+
+@app.get("/admin/collections/{collection_name}/stats")
+def admin_collection_stats(collection_name: str, embedding_model: str = "nomic-embed-text", x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    try:
+        stats = admin_repository(collection_name, embedding_model).stats()
+        if "error" in stats:
+            raise HTTPException(status_code=502, detail=stats["error"])
+        return stats
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.delete("/admin/collections/{collection_name}")
+def admin_clear_collection(collection_name: str, embedding_model: str = "nomic-embed-text", x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    try:
+        if not admin_repository(collection_name, embedding_model).clear():
+            raise HTTPException(status_code=502, detail=f"Failed to clear {collection_name}")
+        return {"collection_name": collection_name, "cleared": True}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+class SnapshotRequest(BaseModel):
+    snapshot: str
+    embedding_model: Optional[str] = "nomic-embed-text"
+    batch_size: int = Field(256, gt=0, le=MAX_BATCH_SIZE)
+
+
+class QAPair(BaseModel):
+    question: str
+    answer: str
+    usecase: Optional[str] = None
+
+
+class IngestRequest(BaseModel):
+    usecase: str
+    pairs: List[QAPair]
+    embedding_model: Optional[str] = "nomic-embed-text"
+    batch_size: int = Field(64, gt=0, le=MAX_BATCH_SIZE)
+    workers: int = Field(4, gt=0, le=MAX_INGEST_WORKERS)
+
+
+def snapshot_path(name: str) -> str:
+    if not name or os.path.basename(name) != name or name.startswith("."):
+        raise HTTPException(status_code=400, detail="Invalid snapshot name")
+    return os.path.join(os.getenv("SNAPSHOT_DIR", "./snapshots"), name)
+
+
+@app.post("/admin/collections/{collection_name}/export")
+def admin_export_collection(collection_name: str, req: SnapshotRequest, x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    try:
+        repository = admin_repository(collection_name, req.embedding_model)
+        return repository.export_snapshot(snapshot_path(req.snapshot), batch_size=req.batch_size)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/admin/collections/{collection_name}/import")
+def admin_import_collection(collection_name: str, req: SnapshotRequest, x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    path = snapshot_path(req.snapshot)
+    if not os.path.isdir(path):
+        raise HTTPException(status_code=404, detail=f"Unknown snapshot: {req.snapshot}")
+    try:
+        repository = admin_repository(collection_name, req.embedding_model)
+        return repository.import_snapshot(path, batch_size=req.batch_size)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/admin/collections/{collection_name}/ingest")
+def admin_ingest_collection(collection_name: str, req: IngestRequest, x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    try:
+        repository = admin_repository(collection_name, req.embedding_model)
+        pairs = [pair.model_dump() for pair in req.pairs]
+        return repository.bulk_ingest(pairs, usecase=req.usecase, batch_size=req.batch_size, workers=req.workers)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/admin/cache/metrics")
+def admin_cache_metrics(x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    return cache_metrics.snapshot()
+
+
+@app.delete("/admin/cache/metrics")
+def admin_reset_cache_metrics(x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    cache_metrics.reset()
+    return {"reset": True}
+
+
+def admin_shared_cache():
+    shared_cache = get_shared_cache()
+    if shared_cache is None:
+        raise HTTPException(status_code=404, detail="Shared cache is disabled")
+    return shared_cache
+
+
+@app.get("/admin/shared-cache/stats")
+def admin_shared_cache_stats(x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    return admin_shared_cache().stats()
+
+
+@app.delete("/admin/shared-cache")
+def admin_clear_shared_cache(x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    if not admin_shared_cache().clear():
+        raise HTTPException(status_code=500, detail="Failed to clear shared cache")
+    return {"cleared": True}
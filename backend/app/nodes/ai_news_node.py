@@ -1,7 +1,11 @@
+import os
+import tempfile
 from tavily import TavilyClient
 from langchain_core.prompts import ChatPromptTemplate
 from backend.app.common.logger import logger
 
+AINEWS_DIR = "./AINews"
+
 class AINewsNode:
     def __init__(self,llm):
         logger.info("Initializing AINewsNode")
@@ -66,15 +70,27 @@ class AINewsNode:
         logger.info("News summarization completed")
         return self.state
     
+    @staticmethod
+    def summary_path(frequency: str) -> str:
+        return f"{AINEWS_DIR}/{frequency}_summary.md"
+
     def save_result(self,state):
         logger.info("Starting to save summarized results")
         frequency = self.state['frequency']
         summary = self.state['summary']
-        filename = f"./AINews/{frequency}_summary.md"
+        filename = self.summary_path(frequency)
         logger.debug(f"Saving summary to file: {filename}")
-        with open(filename, 'w') as f:
-            f.write(f"# {frequency.capitalize()} AI News Summary\n\n")
-            f.write(summary)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filename), prefix=f".{frequency}_summary.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(f"# {frequency.capitalize()} AI News Summary\n\n")
+                f.write(summary)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, filename)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         self.state['filename'] = filename
         logger.info(f"Successfully saved summary to {filename}")
         return self.state
@@ -3,6 +3,7 @@ import json
 from backend.app.state.state import State
 from backend.app.common.logger import logger
 from backend.app.database.qdrant_manager import QdrantManager
+from backend.app.common.cache_metrics import cache_metrics
 from backend.app.nodes.ai_news_node import AINewsNode
 
 class EnhancedAINewsNode(AINewsNode):
@@ -18,16 +19,18 @@ class EnhancedAINewsNode(AINewsNode):
             user_query = messages[-1].content if hasattr(messages[-1], 'content') else str(messages[-1])
         else:
             user_query = state.get('user_message', 'latest AI news')
-        similar_requests = self.qdrant_manager.search_similar_questions(query=user_query, usecase="AI News", limit=3, score_threshold=self.similarity_threshold)
+        similar_requests = self.qdrant_manager.search_similar_questions(query=user_query, usecase="AI News", limit=3, score_threshold=self.similarity_threshold, payload_filter={"type": "news_fetch"})
         if similar_requests:
             logger.info(f"Found similar news request with score: {similar_requests[0]['score']}")
             cached_news = similar_requests[0]['answer']
             try:
                 if isinstance(cached_news, str) and cached_news.startswith('{'):
                     cached_data = json.loads(cached_news)
+                    cache_metrics.record("AI News", hit=True)
                     return {"news_data": cached_data, "from_cache": True}
             except json.JSONDecodeError:
                 logger.warning("Could not parse cached news data")
+        cache_metrics.record("AI News", hit=False)
         result = super().fetch_news(state)
         news_data = result.get('news_data', {})
         self.qdrant_manager.store_qa_pair(
@@ -2,6 +2,7 @@ from typing import Dict, Any
 from backend.app.state.state import State
 from backend.app.common.logger import logger
 from backend.app.database.qdrant_manager import QdrantManager
+from backend.app.common.cache_metrics import cache_metrics
 
 class EnhancedChatbotNode:
     def __init__(self, model, embedding_model: str = "nomic-embed-text"):
@@ -17,18 +18,32 @@ class EnhancedChatbotNode:
             return {"messages": []}
         user_question = messages[-1].content if hasattr(messages[-1], 'content') else str(messages[-1])
         usecase = state.get('usecase', 'Basic Chatbot')
+        shared_cache = self.qdrant_manager.cache
+        if shared_cache is not None:
+            cached_answer = shared_cache.get_answer(usecase, user_question)
+            if cached_answer is not None:
+                logger.info("Found answer in shared worker cache")
+                cache_metrics.record_lookup(usecase, 1.0, query=user_question, threshold=self.similarity_threshold, source="exact")
+                cache_metrics.record(usecase, hit=True)
+                return {"messages": [f"{cached_answer}\n\n*[This response was retrieved from previous similar questions]*"]}
         similar_questions = self.qdrant_manager.search_similar_questions(query=user_question, usecase=usecase, limit=3, score_threshold=self.similarity_threshold)
         if similar_questions and similar_questions[0]['score'] > self.similarity_threshold:
             logger.info(f"Found similar question with score: {similar_questions[0]['score']}")
             cached_answer = similar_questions[0]['answer']
+            cache_metrics.record(usecase, hit=True)
+            if shared_cache is not None:
+                shared_cache.put_answer(usecase, user_question, cached_answer)
             enhanced_answer = f"{cached_answer}\n\n*[This response was retrieved from previous similar questions]*"
             return {"messages": [enhanced_answer]}
         logger.info("No similar questions found, generating new response")
+        cache_metrics.record(usecase, hit=False)
         response = self.llm.invoke(state['messages'])
         if hasattr(response, 'content'):
             answer_content = response.content
         else:
             answer_content = str(response)
+        if shared_cache is not None:
+            shared_cache.put_answer(usecase, user_question, answer_content)
         self.qdrant_manager.store_qa_pair(question=user_question, answer=answer_content, usecase=usecase, metadata={"model": str(self.llm), "method": "llm_generated"})
         return {"messages": response}
 
@@ -17,3 +17,11 @@ class QdrantRepository:
     def clear(self) -> bool:
         return self.manager.clear_collection()
 
+    def export_snapshot(self, path: str, batch_size: int = 256) -> Dict[str, Any]:
+        return self.manager.export_snapshot(path=path, batch_size=batch_size)
+
+    def import_snapshot(self, path: str, batch_size: int = 256) -> Dict[str, Any]:
+        return self.manager.import_snapshot(path=path, batch_size=batch_size)
+
+    def bulk_ingest(self, pairs: List[Dict[str, Any]], usecase: str, batch_size: int = 64, workers: int = 4) -> Dict[str, Any]:
+        return self.manager.bulk_ingest(pairs=pairs, usecase=usecase, batch_size=batch_size, workers=workers)
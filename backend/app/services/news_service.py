@@ -1,9 +1,13 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 from backend.app.factories.llm_factory import LLMFactory
 from backend.app.graph.enhanced_graph_builder import EnhancedGraphBuilder
+from backend.app.nodes.ai_news_node import AINewsNode
 from backend.app.common.logger import logger
 
+SUMMARY_FREQUENCIES = ("daily", "weekly", "monthly", "year")
+SUMMARY_FRESHNESS = {"daily": 3600, "weekly": 6 * 3600, "monthly": 24 * 3600, "year": 7 * 24 * 3600}
+
 class NewsService:
     def __init__(self, embedding_model: str = "nomic-embed-text"):
         provider = os.getenv("DEFAULT_PROVIDER", "Groq")
@@ -24,6 +28,13 @@ class NewsService:
             return "year"
         return "daily"
 
+    @staticmethod
+    def latest_summary_path(frequency: str) -> Optional[str]:
+        if frequency not in SUMMARY_FREQUENCIES:
+            return None
+        path = AINewsNode.summary_path(frequency)
+        return path if os.path.isfile(path) else None
+
     def run(self, timeframe: str) -> Dict[str, Any]:
         graph = self.graph_builder.setup_graph("AI News")
         frequency = self.map_timeframe(timeframe)
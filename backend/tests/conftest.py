@@ -0,0 +1,42 @@
+import hashlib
+import threading
+import pytest
+from qdrant_client import QdrantClient
+from backend.app.database.qdrant_manager import QdrantManager
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.query_calls = 0
+        self.document_calls = 0
+
+    def _vector(self, text):
+        digest = hashlib.md5(text.encode()).digest()
+        return [b - 128.0 for b in digest[:4]]
+
+    def embed_query(self, text):
+        self.query_calls += 1
+        return self._vector(f"query: {text}")
+
+    def embed_documents(self, texts):
+        self.document_calls += 1
+        return [self._vector(f"passage: {t}") for t in texts]
+
+@pytest.fixture
+def make_manager():
+    def factory(collection_name, embedding_model='fake-embed', cache=None):
+        manager = QdrantManager.__new__(QdrantManager)
+        manager.client = QdrantClient(':memory:')
+        # The in-memory client is not thread-safe; a Qdrant server accepts concurrent upserts.
+        lock, upsert = threading.Lock(), manager.client.upsert
+        def locked_upsert(*args, **kwargs):
+            with lock:
+                return upsert(*args, **kwargs)
+        manager.client.upsert = locked_upsert
+        manager.collection_name = collection_name
+        manager.embedding_model = embedding_model
+        manager.embeddings = FakeEmbeddings()
+        manager.cache = cache
+        manager.vector_size = 4
+        manager._ensure_collection_exists()
+        return manager
+    return factory
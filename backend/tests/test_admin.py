@@ -0,0 +1,42 @@
+import pytest
+from fastapi.testclient import TestClient
+from backend.app.main import app
+
+client = TestClient(app)
+
+def test_admin_disabled_without_token(monkeypatch):
+    monkeypatch.delenv('ADMIN_API_TOKEN', raising=False)
+    assert client.get('/admin/cache/metrics').status_code == 503
+    assert client.delete('/admin/collections/qa_collection').status_code == 503
+    r = client.post('/admin/collections/qa_collection/import', json={'snapshot': 'qa'})
+    assert r.status_code == 503
+
+def test_admin_unknown_collection(monkeypatch):
+    monkeypatch.setenv('ADMIN_API_TOKEN', 'secret')
+    r = client.get('/admin/collections/unknown/stats', headers={'X-Admin-Token': 'secret'})
+    assert r.status_code == 404
+
+def test_admin_requires_token(monkeypatch):
+    monkeypatch.setenv('ADMIN_API_TOKEN', 'secret')
+    assert client.get('/admin/cache/metrics').status_code == 401
+    assert client.get('/admin/cache/metrics', headers={'X-Admin-Token': 'wrong'}).status_code == 401
+    r = client.get('/admin/cache/metrics', headers={'X-Admin-Token': 'secret'})
+    assert r.status_code == 200
+
+def test_admin_shared_cache_stats_and_clear(tmp_path, monkeypatch):
+    monkeypatch.setenv('ADMIN_API_TOKEN', 'secret')
+    monkeypatch.setenv('SHARED_CACHE_PATH', str(tmp_path / 'cache.sqlite3'))
+    from backend.app.database.shared_cache import get_shared_cache
+    get_shared_cache().put_answer('Basic Chatbot', 'Hi', 'Hello')
+    headers = {'X-Admin-Token': 'secret'}
+    assert client.get('/admin/shared-cache/stats', headers=headers).json()['answers'] == 1
+    assert client.delete('/admin/shared-cache', headers=headers).status_code == 200
+    assert client.get('/admin/shared-cache/stats', headers=headers).json()['answers'] == 0
+
+def test_admin_ingest_validates_limits(monkeypatch):
+    monkeypatch.setenv('ADMIN_API_TOKEN', 'secret')
+    headers = {'X-Admin-Token': 'secret'}
+    body = {'usecase': 'Basic Chatbot', 'pairs': [{'question': 'q', 'answer': 'a'}]}
+    assert client.post('/admin/collections/qa_collection/ingest', json={**body, 'batch_size': 0}, headers=headers).status_code == 422
+    assert client.post('/admin/collections/qa_collection/ingest', json={**body, 'workers': 1000}, headers=headers).status_code == 422
+    assert client.post('/admin/collections/qa_collection/export', json={'snapshot': 'qa', 'batch_size': 0}, headers=headers).status_code == 422
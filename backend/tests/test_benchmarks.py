@@ -24,3 +24,30 @@ def test_bench_news_summary():
     m = bench_call('/news/summary', {'timeframe': 'last 24 hours'})
     assert m >= 0
 
+
+def bench_shared_cache(path, workers: int = 4, entries: int = 200, dim: int = 768):
+    import numpy as np
+    from backend.app.database.shared_cache import SharedCache
+    vectors = np.random.rand(entries, dim).astype(np.float32)
+    shared = SharedCache(path=path)
+    per_process = {}
+    for i in range(entries):
+        shared.put_embedding('bench', f'q{i}', vectors[i])
+        per_process[f'q{i}'] = vectors[i].copy()
+    def median_ms(fn):
+        times = []
+        for i in range(entries):
+            t0 = time.perf_counter()
+            fn(f'q{i}')
+            times.append((time.perf_counter() - t0) * 1000)
+        return statistics.median(times)
+    return {
+        'shared_hit_ms': median_ms(lambda k: shared.get_embedding('bench', k)),
+        'per_process_hit_ms': median_ms(lambda k: per_process.get(k)),
+        'shared_bytes': shared.stats()['size_bytes'],
+        'per_process_bytes': workers * sum(v.nbytes for v in per_process.values()),
+    }
+
+def test_bench_shared_cache_vs_per_process(tmp_path):
+    m = bench_shared_cache(str(tmp_path / 'bench.sqlite3'))
+    assert m['shared_hit_ms'] >= 0 and m['per_process_hit_ms'] >= 0
@@ -0,0 +1,94 @@
+import json
+from backend.app.common.cache_metrics import CacheMetrics
+from backend.app.cli.tune_thresholds import evaluate_thresholds, main
+
+def test_cache_metrics_counts_and_histogram(tmp_path, monkeypatch):
+    monkeypatch.setenv('SHARED_CACHE_PATH', str(tmp_path / 'cache.sqlite3'))
+    log = tmp_path / 'queries.jsonl'
+    monkeypatch.setenv('CACHE_QUERY_LOG_PATH', str(log))
+    metrics = CacheMetrics()
+    metrics.record_lookup('Basic Chatbot', 0.91, query='hi', threshold=0.8)
+    metrics.record('Basic Chatbot', hit=True)
+    metrics.record_lookup('Basic Chatbot', 0.42, query='hello', threshold=0.8)
+    metrics.record('Basic Chatbot', hit=False)
+    metrics.record_lookup('AI News', 0.9, query='daily', threshold=0.75)
+    metrics.record('AI News', hit=False)
+    snap = metrics.snapshot()
+    assert snap['shared'] is True
+    chat = snap['usecases']['Basic Chatbot']
+    assert chat['hits'] == 1 and chat['misses'] == 1 and chat['hit_rate'] == 0.5
+    assert chat['top1_score_histogram'] == {'0.40-0.45': 1, '0.90-0.95': 1}
+    news = snap['usecases']['AI News']
+    assert news['hits'] == 0 and news['misses'] == 1
+    assert news['top1_score_histogram'] == {'0.90-0.95': 1}
+    assert len(log.read_text().splitlines()) == 3
+    metrics.reset()
+    assert metrics.snapshot()['usecases'] == {}
+
+def test_evaluate_thresholds():
+    report = evaluate_thresholds([0.95, 0.82, 0.7, None], [0.75, 0.9])
+    assert [r['hits'] for r in report] == [2, 1]
+    assert report[0]['hit_rate'] == 0.5
+    assert report[1]['llm_calls_avoided'] == 1
+
+def test_tune_thresholds_logged_scores(tmp_path, capsys):
+    log = tmp_path / 'queries.jsonl'
+    log.write_text('\n'.join(json.dumps(e) for e in [
+        {'usecase': 'Basic Chatbot', 'query': 'a', 'top_score': 0.85},
+        {'usecase': 'Basic Chatbot', 'query': 'b', 'top_score': 0.6},
+        {'usecase': 'AI News', 'query': 'daily', 'top_score': 0.8},
+    ]))
+    report = main([str(log), '--logged-scores', '--thresholds', '0.75,0.8', '--json'])
+    assert report['Basic Chatbot'][0]['hits'] == 1
+    assert report['AI News'][1]['hits'] == 1
+    assert report['AI News'][1]['llm_calls_avoided'] == 0
+
+def test_news_match_not_served_counts_as_miss(tmp_path, monkeypatch):
+    from backend.app.nodes.ai_news_node import AINewsNode
+    from backend.app.nodes.enhanced_ai_news_node import EnhancedAINewsNode
+    monkeypatch.setenv('SHARED_CACHE_PATH', str(tmp_path / 'cache.sqlite3'))
+    metrics = CacheMetrics()
+    monkeypatch.setattr('backend.app.nodes.enhanced_ai_news_node.cache_metrics', metrics)
+    monkeypatch.setattr(AINewsNode, 'fetch_news', lambda self, state: {'news_data': []})
+
+    class FakeManager:
+        def __init__(self):
+            self.filters = []
+        def search_similar_questions(self, **kwargs):
+            self.filters.append(kwargs.get('payload_filter'))
+            return [{'question': 'daily', 'answer': 'AI news summary text', 'score': 0.9, 'metadata': {}}]
+        def store_qa_pair(self, **kwargs):
+            return True
+
+    node = EnhancedAINewsNode.__new__(EnhancedAINewsNode)
+    node.qdrant_manager = FakeManager()
+    node.similarity_threshold = 0.75
+    node.fetch_news({'messages': ['daily']})
+    assert node.qdrant_manager.filters == [{'type': 'news_fetch'}]
+    news = metrics.snapshot()['usecases']['AI News']
+    assert news['hits'] == 0 and news['misses'] == 1
+
+def test_exact_shared_cache_hit_is_logged(tmp_path, monkeypatch):
+    from backend.app.database.shared_cache import SharedCache
+    from backend.app.nodes.enhanced_chatbot_node import EnhancedChatbotNode
+    from backend.app.cli.tune_thresholds import load_queries, replay_scores
+    log = tmp_path / 'queries.jsonl'
+    monkeypatch.setenv('SHARED_CACHE_PATH', str(tmp_path / 'cache.sqlite3'))
+    monkeypatch.setenv('CACHE_QUERY_LOG_PATH', str(log))
+    metrics = CacheMetrics()
+    monkeypatch.setattr('backend.app.nodes.enhanced_chatbot_node.cache_metrics', metrics)
+
+    class FakeManager:
+        cache = SharedCache(path=str(tmp_path / 'answers.sqlite3'))
+
+    FakeManager.cache.put_answer('Basic Chatbot', 'What is AI?', 'Artificial intelligence')
+    node = EnhancedChatbotNode.__new__(EnhancedChatbotNode)
+    node.qdrant_manager = FakeManager()
+    node.similarity_threshold = 0.8
+    result = node.process({'messages': ['What is AI?'], 'usecase': 'Basic Chatbot'})
+    assert result['messages'][0].startswith('Artificial intelligence')
+    entry = json.loads(log.read_text())
+    assert entry['source'] == 'exact' and entry['top_score'] == 1.0
+    chat = metrics.snapshot()['usecases']['Basic Chatbot']
+    assert chat['hits'] == 1 and chat['top1_score_histogram'] == {'0.95-1.00': 1}
+    assert replay_scores(load_queries(str(log)), 'nomic-embed-text') == {'Basic Chatbot': [1.0]}
@@ -9,3 +9,30 @@ def test_news_requires_backend_defaults(monkeypatch):
     monkeypatch.setenv('DEFAULT_MODEL','llama3.2:1b')
     r = client.post('/news/summary', json={'timeframe': 'last 24 hours'})
     assert r.status_code in (200, 500)
+
+def test_latest_summary_etag_and_conditional_get(tmp_path, monkeypatch):
+    monkeypatch.setattr('backend.app.nodes.ai_news_node.AINEWS_DIR', str(tmp_path))
+    (tmp_path / 'daily_summary.md').write_text('# Daily AI News Summary\n\n### 2026-10-19\n- item\n')
+    r = client.get('/news/summary/daily', headers={'Accept-Encoding': 'gzip'})
+    assert r.status_code == 200
+    assert r.headers['content-encoding'] == 'gzip'
+    assert r.text.startswith('# Daily AI News Summary')
+    assert 'max-age=' in r.headers['cache-control']
+    assert r.headers['last-modified']
+    r2 = client.get('/news/summary/daily', headers={'If-None-Match': r.headers['etag']})
+    assert r2.status_code == 304
+    assert r2.headers['etag'] == r.headers['etag']
+
+def test_latest_summary_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr('backend.app.nodes.ai_news_node.AINEWS_DIR', str(tmp_path))
+    assert client.get('/news/summary/daily').status_code == 404
+    assert client.get('/news/summary/hourly').status_code == 404
+
+def test_save_result_is_atomic(tmp_path, monkeypatch):
+    from backend.app.nodes.ai_news_node import AINewsNode
+    monkeypatch.setattr('backend.app.nodes.ai_news_node.AINEWS_DIR', str(tmp_path))
+    node = AINewsNode.__new__(AINewsNode)
+    node.state = {'frequency': 'weekly', 'summary': '- item'}
+    node.save_result({})
+    assert (tmp_path / 'weekly_summary.md').read_text() == '# Weekly AI News Summary\n\n- item'
+    assert [p.name for p in tmp_path.iterdir()] == ['weekly_summary.md']
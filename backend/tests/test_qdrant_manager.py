@@ -0,0 +1,46 @@
+from backend.app.database.shared_cache import SharedCache
+
+def test_collection_stats_and_clear(make_manager):
+    manager = make_manager('qa_collection')
+    manager.bulk_ingest([{'question': f'q{i}', 'answer': f'a{i}'} for i in range(5)], usecase='Basic Chatbot')
+    stats = manager.get_collection_stats()
+    assert stats['points_count'] == 5
+    assert stats['vector_size'] == 4
+    assert manager.clear_collection()
+    stats = manager.get_collection_stats()
+    assert stats['points_count'] == 0
+    info = manager.client.get_collection('qa_collection')
+    assert info.config.params.vectors.size == 4
+
+def test_clear_collection_only_drops_its_usecases(tmp_path, make_manager):
+    cache = SharedCache(path=str(tmp_path / 'cache.sqlite3'))
+    cache.put_answer('Basic Chatbot', 'What is AI?', 'Artificial intelligence')
+    cache.put_answer('AI News', 'daily', 'summary')
+    news = make_manager('ai_news_collection', cache=cache)
+    news.store_qa_pair('daily', '{}', usecase='AI News')
+    assert news.clear_collection()
+    assert cache.get_answer('AI News', 'daily') is None
+    assert cache.get_answer('Basic Chatbot', 'What is AI?') == 'Artificial intelligence'
+
+def test_collection_stats_missing_collection(make_manager):
+    manager = make_manager('qa_collection')
+    manager.client.delete_collection('qa_collection')
+    assert 'error' in manager.get_collection_stats()
+
+def test_top_match_score_ignores_points_stored_after_query(make_manager):
+    import time
+    manager = make_manager('qa_collection')
+    manager.store_qa_pair('What is AI?', 'Artificial intelligence', usecase='Basic Chatbot')
+    logged_at = time.time() + 2
+    assert abs(manager.top_match_score('What is AI?', 'Basic Chatbot', stored_before=logged_at) - 1.0) < 1e-6
+    assert manager.top_match_score('What is AI?', 'Basic Chatbot', stored_before=logged_at - 60) is None
+
+def test_clear_collection_keeps_existing_vector_params(make_manager):
+    manager = make_manager('qa_collection')
+    manager.store_qa_pair('What is AI?', 'Artificial intelligence', usecase='Basic Chatbot')
+    manager.vector_size = 768
+    stats = manager.get_collection_stats()
+    assert stats['vector_size'] == 4 and stats['embedding_vector_size'] == 768
+    assert manager.clear_collection()
+    assert manager.client.get_collection('qa_collection').config.params.vectors.size == 4
+    assert manager.get_collection_stats()['vector_size'] == 4
@@ -0,0 +1,42 @@
+import multiprocessing
+from backend.app.database.shared_cache import SharedCache
+
+def _write_from_worker(path: str):
+    cache = SharedCache(path=path)
+    cache.put_answer('Basic Chatbot', 'What is LangGraph?', 'A graph runtime')
+    cache.put_embedding('nomic-embed-text', 'What is LangGraph?', [0.1, 0.2, 0.3])
+
+def test_shared_cache_roundtrip(tmp_path):
+    cache = SharedCache(path=str(tmp_path / 'cache.sqlite3'))
+    assert cache.get_answer('Basic Chatbot', 'Hi') is None
+    cache.put_answer('Basic Chatbot', 'Hi  there', 'Hello')
+    assert cache.get_answer('Basic Chatbot', 'hi there') == 'Hello'
+    assert cache.get_answer('Chatbot With Web', 'hi there') is None
+    cache.put_embedding('nomic-embed-text', 'Hi', [0.5, -0.25])
+    assert cache.get_embedding('nomic-embed-text', 'Hi') == [0.5, -0.25]
+    assert cache.get_embedding('text-embedding-3-small', 'Hi') is None
+    assert cache.clear()
+    assert cache.stats()['answers'] == 0
+
+def test_shared_cache_hit_across_processes(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    reader = SharedCache(path=path)
+    proc = multiprocessing.get_context('spawn').Process(target=_write_from_worker, args=(path,))
+    proc.start()
+    proc.join(30)
+    assert proc.exitcode == 0
+    assert reader.get_answer('Basic Chatbot', 'what is langgraph?') == 'A graph runtime'
+    vector = reader.get_embedding('nomic-embed-text', 'What is LangGraph?')
+    assert [round(v, 3) for v in vector] == [0.1, 0.2, 0.3]
+
+def test_shared_cache_prunes_oldest_and_expired(tmp_path):
+    cache = SharedCache(path=str(tmp_path / 'cache.sqlite3'), answer_ttl=60, max_embeddings=3, max_answers=2, prune_every=1)
+    for i in range(5):
+        cache.put_embedding('nomic-embed-text', f'q{i}', [float(i)])
+    assert cache.stats()['embeddings'] == 3
+    assert cache.get_embedding('nomic-embed-text', 'q0') is None
+    assert cache.get_embedding('nomic-embed-text', 'q4') == [4.0]
+    cache._connect().execute("INSERT INTO answers VALUES ('old', 'Basic Chatbot', 'old', 'stale', 0)")
+    cache.put_answer('Basic Chatbot', 'fresh', 'answer')
+    assert cache.stats()['answers'] == 1
+    assert cache.get_answer('Basic Chatbot', 'fresh') == 'answer'
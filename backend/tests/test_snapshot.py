@@ -0,0 +1,70 @@
+import os
+import pytest
+from backend.app.database.snapshot import write_snapshot, read_snapshot, load_qa_dataset
+
+def test_snapshot_roundtrip(tmp_path):
+    batches = iter([(['a', 'b'], [[1, 2], [3, 4]], [{'question': 'q1'}, {'question': 'q2'}]), (['c'], [[5, 6]], [{'question': 'q3'}])])
+    manifest = write_snapshot(str(tmp_path), 'qa_collection', 'fake-embed', 2, batches)
+    assert manifest['count'] == 3
+    read = list(read_snapshot(str(tmp_path), batch_size=2))
+    assert [ids for ids, _, _ in read] == [['a', 'b'], ['c']]
+    assert read[1][1].tolist() == [[5.0, 6.0]]
+
+def test_bulk_ingest_export_import(tmp_path, make_manager):
+    source = make_manager('qa_collection')
+    pairs = [{'question': f'question {i}', 'answer': f'answer {i}'} for i in range(10)] + [{'question': 'no answer'}]
+    progress = []
+    result = source.bulk_ingest(pairs, usecase='Basic Chatbot', batch_size=3, workers=2, progress=lambda d, t: progress.append((d, t)))
+    assert result == {'collection_name': 'qa_collection', 'ingested': 10, 'failed': 0, 'total': 10}
+    assert source.embeddings.document_calls == 0
+    assert progress[-1] == (10, 10)
+
+    top = source.search_similar_questions('question 7', 'Basic Chatbot', limit=1)
+    assert top[0]['question'] == 'question 7' and top[0]['score'] > 0.999
+
+    manifest = source.export_snapshot(str(tmp_path / 'snap'), batch_size=4)
+    assert manifest['count'] == 10
+
+    target = make_manager('qa_collection')
+    imported = target.import_snapshot(str(tmp_path / 'snap'), batch_size=4)
+    assert imported['imported'] == 10 and imported['reused_vectors'] is True
+    assert target.embeddings.query_calls == 0
+    assert target.client.count('qa_collection').count == 10
+
+    other = make_manager('qa_collection', embedding_model='other-embed')
+    assert other.import_snapshot(str(tmp_path / 'snap'))['reused_vectors'] is False
+    assert other.embeddings.query_calls == 10 and other.embeddings.document_calls == 0
+    assert other.search_similar_questions('question 4', 'Basic Chatbot', limit=1)[0]['score'] > 0.999
+
+def test_load_qa_dataset_csv(tmp_path):
+    path = tmp_path / 'pairs.csv'
+    path.write_text('question,answer\nWhat is AI?,Artificial intelligence\n')
+    assert load_qa_dataset(str(path)) == [{'question': 'What is AI?', 'answer': 'Artificial intelligence'}]
+
+def test_export_refuses_vector_size_mismatch(tmp_path, make_manager):
+    manager = make_manager('qa_collection')
+    manager.bulk_ingest([{'question': f'q{i}', 'answer': f'a{i}'} for i in range(3)], usecase='Basic Chatbot')
+    manager.vector_size = 2
+    with pytest.raises(ValueError):
+        manager.export_snapshot(str(tmp_path / 'snap'))
+    assert not os.path.exists(tmp_path / 'snap' / 'manifest.json')
+    batches = iter([(['a', 'b', 'c'], [[1.0] * 4] * 3, [{}, {}, {}])])
+    with pytest.raises(ValueError):
+        write_snapshot(str(tmp_path / 'raw'), 'qa_collection', 'fake-embed', 12, batches)
+
+def test_import_reembeds_when_snapshot_size_differs(tmp_path, make_manager):
+    write_snapshot(str(tmp_path / 'snap'), 'qa_collection', 'fake-embed', 2, iter([(['00000000-0000-0000-0000-000000000001'], [[1.0, 0.0]], [{'question': 'What is AI?', 'answer': 'AI', 'usecase': 'Basic Chatbot'}])]))
+    manager = make_manager('qa_collection')
+    result = manager.import_snapshot(str(tmp_path / 'snap'))
+    assert result['reused_vectors'] is False
+    assert manager.embeddings.query_calls == 1
+
+def test_bulk_limits_are_enforced(make_manager):
+    from backend.app.cli.snapshot import main
+    manager = make_manager('qa_collection')
+    with pytest.raises(ValueError):
+        manager.bulk_ingest([{'question': 'q', 'answer': 'a'}], usecase='Basic Chatbot', batch_size=0)
+    with pytest.raises(ValueError):
+        manager.bulk_ingest([{'question': 'q', 'answer': 'a'}], usecase='Basic Chatbot', workers=1000)
+    with pytest.raises(SystemExit):
+        main(['ingest', 'qa_collection', 'pairs.jsonl', '--workers', '0'])